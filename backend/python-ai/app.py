@@ -1,14 +1,121 @@
 from modules.zai_reader.zai_reader import DocumentReader
-from pydantic import BaseModel
-from fastapi import FastAPI
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import List
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from datetime import datetime
+from collections import OrderedDict, deque
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+
+import numpy as np
+
+from pooling import mean_pool, l2_normalize
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    HAS_ORT = True
+except ImportError:
+    HAS_ORT = False
+    logging.warning("onnxruntime/transformers not installed. /embed disabled.")
+
+logger = logging.getLogger(__name__)
+
+# Embedding model configuration (exported sentence-transformer in ONNX format)
+EMBED_MODEL_PATH = os.environ.get("ZAI_EMBED_MODEL", "model.onnx")
+# Dynamic INT8 quantization: ~2.5-4.5x faster on VNNI-capable CPUs with
+# <1pt accuracy drop for BERT-class models. Set ZAI_EMBED_INT8=0 to disable.
+EMBED_USE_INT8 = os.environ.get("ZAI_EMBED_INT8", "1") == "1"
+# Number of ORT sessions to round-robin across; >1 helps on multi-socket
+# or NUMA hosts where one MLAS thread pool contends with itself
+EMBED_NUM_SESSIONS = max(1, int(os.environ.get("ZAI_EMBED_SESSIONS", "1")))
+EMBED_TOKENIZER = os.environ.get(
+    "ZAI_EMBED_TOKENIZER", "sentence-transformers/all-MiniLM-L6-v2"
+)
+EMBED_MAX_LENGTH = 128
+
+# Micro-batching: collect concurrent /embed requests for up to
+# EMBED_MAX_WAIT_MS (or until EMBED_MAX_BATCH) and run one forward pass.
+EMBED_MAX_BATCH = 32
+EMBED_MAX_WAIT_MS = 10
+
+# Embedding cache: repeated texts (duplicate chunks, common queries)
+# skip tokenization and the forward pass entirely
+EMBED_CACHE_SIZE = 50_000
+
+
+class EmbeddingCache:
+    """
+    Content-hashed LRU cache of embedding vectors.
+
+    Keys are 16-byte blake2b digests of the text, so cache memory is
+    bounded by EMBED_CACHE_SIZE vectors regardless of input length.
+    Thread-safe: lookups come from the event loop while inserts can
+    arrive from executor threads.
+    """
+
+    def __init__(self, maxsize: int = EMBED_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, text: str):
+        key = self._key(text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+            return vector
+
+    def put(self, text: str, vector):
+        key = self._key(text)
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+embed_cache = EmbeddingCache()
+
+
+class SessionPool:
+    """
+    Round-robin pool of ONNX Runtime sessions.
+
+    session.run is thread-safe, so concurrent batches simply take the
+    next session in turn; with ZAI_EMBED_SESSIONS > 1 each session gets
+    its own MLAS thread pool sized to cores // N, avoiding contention on
+    a single intra-op pool.
+    """
+
+    def __init__(self, sessions):
+        self._sessions = deque(sessions)
+        self._lock = threading.Lock()
+
+    def next(self):
+        with self._lock:
+            session = self._sessions[0]
+            self._sessions.rotate(-1)
+            return session
 
 class FolderRequest(BaseModel):
     folder_path: str
 
-app = FastAPI(title="ZAI Python AI Service")
+app = FastAPI(
+    title="ZAI Python AI Service",
+    default_response_class=ORJSONResponse,
+)
 
 # allow local dashboard to call this during dev
 app.add_middleware(
@@ -19,9 +126,201 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# compress big /read-folder payloads (extracted text is 3-10x compressible)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 class Query(BaseModel):
     text: str
 
+
+def quantized_model_path(model_path: str) -> str:
+    """
+    Return the path of the INT8-quantized model, producing it on first use.
+
+    Runs ONNX Runtime dynamic quantization (QInt8 weights for MatMul and
+    Attention ops) once and caches the result next to the FP32 model.
+    Falls back to the FP32 path if quantization is unavailable or fails.
+    """
+    int8_path = os.path.splitext(model_path)[0] + ".int8.onnx"
+    if os.path.exists(int8_path):
+        return int8_path
+
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        quantize_dynamic(
+            model_path,
+            int8_path,
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["MatMul", "Attention"],
+        )
+        logger.info(f"Quantized embedding model written to {int8_path}")
+        return int8_path
+    except Exception as e:
+        logger.warning(f"INT8 quantization failed, using FP32 model: {e}")
+        return model_path
+
+
+class BatchQuery(BaseModel):
+    texts: List[str] = Field(..., min_items=1, max_items=64)
+
+
+@app.on_event("startup")
+def load_embedding_model():
+    """
+    Load the ONNX embedding model and tokenizer once at startup.
+
+    The session is created with ORT_ENABLE_ALL graph optimizations so ORT
+    fuses LayerNorm/MatMul+Add/GELU and runs the MLAS SGEMM kernels, which
+    is dramatically faster than per-request PyTorch inference on CPU.
+    """
+    app.state.session_pool = None
+    app.state.tokenizer = None
+
+    if not HAS_ORT:
+        logger.warning("Embedding model not loaded: onnxruntime unavailable")
+        return
+
+    if not os.path.exists(EMBED_MODEL_PATH):
+        logger.warning(f"Embedding model not loaded: {EMBED_MODEL_PATH} not found")
+        return
+
+    model_path = EMBED_MODEL_PATH
+    if EMBED_USE_INT8:
+        model_path = quantized_model_path(EMBED_MODEL_PATH)
+
+    # Split the cores across the pool so each session's MLAS thread
+    # pool stays on its own slice
+    threads_per_session = max(1, (os.cpu_count() or 1) // EMBED_NUM_SESSIONS)
+
+    sessions = []
+    for _ in range(EMBED_NUM_SESSIONS):
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = threads_per_session
+        so.add_session_config_entry("session.use_env_allocators", "1")
+        sessions.append(
+            ort.InferenceSession(
+                model_path,
+                sess_options=so,
+                providers=["CPUExecutionProvider"],
+            )
+        )
+
+    app.state.session_pool = SessionPool(sessions)
+    app.state.tokenizer = AutoTokenizer.from_pretrained(EMBED_TOKENIZER)
+    logger.info(
+        f"Embedding model loaded from {model_path} "
+        f"({EMBED_NUM_SESSIONS} session(s), {threads_per_session} threads each)"
+    )
+
+    # Start the micro-batching consumer once the session is available
+    app.state.embed_queue = asyncio.Queue()
+    app.state.embed_worker = asyncio.get_event_loop().create_task(
+        embed_batch_worker()
+    )
+
+
+async def embed_batch_worker():
+    """
+    Consumer task for the /embed micro-batcher.
+
+    Drains up to EMBED_MAX_BATCH queued (text, future) pairs — waiting at
+    most EMBED_MAX_WAIT_MS for stragglers — then runs a single batched
+    forward pass and hands each caller its row. Batching amortizes the
+    per-call tokenizer/ORT overhead across concurrent requests.
+    """
+    loop = asyncio.get_event_loop()
+    queue = app.state.embed_queue
+
+    while True:
+        # Block for the first item, then give concurrent requests a short
+        # window to join the batch.
+        batch = [await queue.get()]
+        deadline = loop.time() + EMBED_MAX_WAIT_MS / 1000.0
+
+        while len(batch) < EMBED_MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        texts = [text for text, _ in batch]
+        try:
+            # session.run releases the GIL; keep the event loop responsive
+            vectors = await loop.run_in_executor(None, run_embedding, texts)
+        except Exception as e:
+            logger.error(f"Embedding batch failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+async def embed_text(text: str):
+    """Queue one text through the micro-batcher and await its vector."""
+    vector = embed_cache.get(text)
+    if vector is not None:
+        return vector
+
+    future = asyncio.get_event_loop().create_future()
+    await app.state.embed_queue.put((text, future))
+    vector = await future
+    embed_cache.put(text, vector)
+    return vector
+
+
+def run_embedding(texts):
+    """
+    Tokenize a list of texts and run one batched forward pass.
+
+    Returns an (N, hidden_dim) float32 NumPy array of mask-aware
+    mean-pooled, L2-normalized vectors.
+    """
+    encoded = app.state.tokenizer(
+        texts,
+        padding=True,
+        truncation=True,
+        max_length=EMBED_MAX_LENGTH,
+        return_tensors="np",
+    )
+    feeds = {
+        "input_ids": encoded["input_ids"].astype(np.int64),
+        "attention_mask": encoded["attention_mask"].astype(np.int64),
+    }
+    hidden = app.state.session_pool.next().run(None, feeds)[0]
+    return l2_normalize(mean_pool(hidden, encoded["attention_mask"]))
+
+def wants_binary(request: Request) -> bool:
+    """True when the client asked for raw vector bytes via Accept."""
+    return "application/octet-stream" in request.headers.get("accept", "")
+
+
+def binary_embedding_response(vectors: np.ndarray) -> Response:
+    """
+    Pack embeddings as raw little-endian float16 bytes.
+
+    ~8x smaller than the JSON float lists and zero-parse on the client:
+    np.frombuffer(content, dtype=np.float16).reshape(shape) with the
+    shape taken from the X-Embedding-Shape header ("rows,dim").
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float16)
+    return Response(
+        content=vectors.tobytes(),
+        media_type="application/octet-stream",
+        headers={
+            "X-Embedding-Shape": f"{vectors.shape[0]},{vectors.shape[1]}",
+            "X-Embedding-Dtype": "float16",
+        },
+    )
+
 @app.get("/")
 def home():
     return {"message": "ZAI Python AI service ✅"}
@@ -31,21 +330,64 @@ def health():
     return {"status": "ok"}
 
 @app.post("/embed")
-def embed(query: Query):
+async def embed(query: Query, request: Request):
     """
-    Placeholder embed endpoint:
-    Returns a tiny dummy vector (for now) to test the pipeline.
-    Replace with real embedding code later (sentence-transformers etc.).
+    Embed a single text with the ONNX Runtime sentence embedder.
+
+    Requests go through the micro-batcher: concurrent callers share one
+    batched tokenize + session.run + mean-pool, each getting its row back
+    as an FP32 vector. Send "Accept: application/octet-stream" to get
+    the vector as raw float16 bytes instead of a JSON list.
     """
+    if app.state.session_pool is None:
+        raise HTTPException(status_code=503, detail="Embedding model not loaded")
+
     text = query.text or ""
-    # dummy embedding — simple length-based vector for testing
-    vector = [len(text), len(text) % 10, (len(text) * 7) % 97]
-    return {"embedding": vector, "text_len": len(text)}
+    vector = await embed_text(text)
+
+    if wants_binary(request):
+        return binary_embedding_response(vector.reshape(1, -1))
+    return {"embedding": vector.tolist(), "dim": int(vector.shape[0])}
+
+@app.post("/embed/batch")
+async def embed_batch(query: BatchQuery, request: Request):
+    """
+    Embed a list of texts with a single tokenizer + model call.
+
+    One padded tensor and one session.run for the whole batch — far
+    cheaper than N round-trips to /embed for bulk callers. Send
+    "Accept: application/octet-stream" to get the matrix as raw float16
+    bytes instead of JSON lists.
+    """
+    if app.state.session_pool is None:
+        raise HTTPException(status_code=503, detail="Embedding model not loaded")
+
+    if any(not text for text in query.texts):
+        raise HTTPException(status_code=422, detail="texts must be non-empty strings")
+
+    # Serve cached texts directly; only misses go through the model
+    vectors = [embed_cache.get(text) for text in query.texts]
+    miss_indices = [i for i, vector in enumerate(vectors) if vector is None]
+
+    if miss_indices:
+        miss_texts = [query.texts[i] for i in miss_indices]
+        loop = asyncio.get_event_loop()
+        computed = await loop.run_in_executor(None, run_embedding, miss_texts)
+        for i, vector in zip(miss_indices, computed):
+            embed_cache.put(query.texts[i], vector)
+            vectors[i] = vector
+
+    if wants_binary(request):
+        return binary_embedding_response(np.stack(vectors))
+    return {
+        "embeddings": [vector.tolist() for vector in vectors],
+        "dim": int(vectors[0].shape[0]),
+    }
 
 @app.post("/read-folder")
 def read_folder(req: FolderRequest):
     reader = DocumentReader(max_file_size_mb=50)
-    files = reader.scan_folder(req.folder_path)
+    files = [doc.to_dict() for doc in reader.scan_folder(req.folder_path)]
     return {"files": files}
 
 # ✅ New ping route
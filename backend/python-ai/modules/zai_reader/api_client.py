@@ -1,24 +1,44 @@
 #!/usr/bin/env python3
 """
-FastAPI client: Submit scan request and poll for results.
+FastAPI client: Submit scan request and wait for results.
+
+Uses httpx with a persistent keep-alive connection pool so repeated
+calls reuse one TCP connection instead of paying the handshake cost
+per request. An async variant is provided for waiting on many tasks
+concurrently.
 """
 
-import requests
+import httpx
+import asyncio
 import time
 import json
 import sys
-from typing import Optional, Dict
+from typing import Dict, List
+
+# Shared pool limits: enough keep-alive connections for bursty clients
+# without unbounded socket growth
+_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+
 
 class ZAIReaderClient:
     """Client for ZAI Reader API."""
 
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
+        self._client = httpx.Client(
+            base_url=base_url,
+            limits=_LIMITS,
+            timeout=30.0
+        )
+
+    def close(self):
+        """Close the underlying connection pool."""
+        self._client.close()
 
     def start_scan(self, folder_path: str, max_size_mb: int = 50) -> str:
         """Start a folder scan and return task ID."""
-        response = requests.post(
-            f"{self.base_url}/read-folder",
+        response = self._client.post(
+            "/read-folder",
             json={
                 "folder_path": folder_path,
                 "max_file_size_mb": max_size_mb
@@ -29,25 +49,90 @@ class ZAIReaderClient:
 
     def get_task_status(self, task_id: str) -> Dict:
         """Get status of a task."""
-        response = requests.get(f"{self.base_url}/read-folder/{task_id}")
+        response = self._client.get(f"/read-folder/{task_id}")
         response.raise_for_status()
         return response.json()
 
-    def wait_for_completion(self, task_id: str, timeout: int = 600, poll_interval: int = 2):
-        """Poll until task completes."""
+    def wait_for_completion(self, task_id: str, timeout: int = 600):
+        """Long-poll the server until the task completes."""
         start_time = time.time()
 
+        # One blocking round-trip per server-side wait window instead of
+        # re-requesting every few seconds
         while time.time() - start_time < timeout:
-            task = self.get_task_status(task_id)
+            remaining = timeout - (time.time() - start_time)
+            response = self._client.get(
+                f"/read-folder/{task_id}/wait",
+                params={"timeout": min(remaining, 60)},
+                timeout=remaining + 10
+            )
+            response.raise_for_status()
+            task = response.json()
 
             if task['status'] in ['completed', 'failed']:
                 return task
 
             print(f"Status: {task['status']}... (elapsed: {int(time.time() - start_time)}s)")
-            time.sleep(poll_interval)
 
         raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
+
+class AsyncZAIReaderClient:
+    """Async client for batch scans against the ZAI Reader API."""
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=_LIMITS,
+            timeout=30.0
+        )
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def start_scan(self, folder_path: str, max_size_mb: int = 50) -> str:
+        """Start a folder scan and return task ID."""
+        response = await self._client.post(
+            "/read-folder",
+            json={
+                "folder_path": folder_path,
+                "max_file_size_mb": max_size_mb
+            }
+        )
+        response.raise_for_status()
+        return response.json()['task_id']
+
+    async def wait_for_completion(self, task_id: str, timeout: int = 600) -> Dict:
+        """Long-poll the server until the task completes."""
+        start_time = time.time()
+
+        while time.time() - start_time < timeout:
+            remaining = timeout - (time.time() - start_time)
+            response = await self._client.get(
+                f"/read-folder/{task_id}/wait",
+                params={"timeout": min(remaining, 60)},
+                timeout=remaining + 10
+            )
+            response.raise_for_status()
+            task = response.json()
+
+            if task['status'] in ['completed', 'failed']:
+                return task
+
+        raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
+
+    async def scan_folders(self, folder_paths: List[str], timeout: int = 600) -> List[Dict]:
+        """Scan several folders concurrently over one connection pool."""
+        task_ids = await asyncio.gather(
+            *(self.start_scan(path) for path in folder_paths)
+        )
+        return await asyncio.gather(
+            *(self.wait_for_completion(tid, timeout) for tid in task_ids)
+        )
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python api_client.py /path/to/folder")
@@ -56,12 +141,15 @@ def main():
     folder = sys.argv[1]
     client = ZAIReaderClient()
 
-    print(f"Starting scan for: {folder}")
-    task_id = client.start_scan(folder)
-    print(f"Task ID: {task_id}")
+    try:
+        print(f"Starting scan for: {folder}")
+        task_id = client.start_scan(folder)
+        print(f"Task ID: {task_id}")
 
-    print("\nWaiting for completion...")
-    result = client.wait_for_completion(task_id)
+        print("\nWaiting for completion...")
+        result = client.wait_for_completion(task_id)
+    finally:
+        client.close()
 
     if result['status'] == 'completed':
         print(f"✓ Scan complete!")
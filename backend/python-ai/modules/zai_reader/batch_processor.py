@@ -4,14 +4,68 @@ Batch processor: Scan multiple folders and save results to JSON.
 """
 
 from zai_reader import DocumentReader
+from text_stats import summarize_documents
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import json
+import orjson
+import os
 from datetime import datetime
 
-def process_multiple_folders(folder_list):
-    """Process multiple folders and compile report."""
-    reader = DocumentReader(max_file_size_mb=100)
 
+def _scan_one(folder_path, max_file_size_mb=100):
+    """
+    Scan a single folder in a worker process.
+
+    The DocumentReader is built inside the worker so nothing heavy is
+    pickled across the process boundary.
+
+    Returns:
+        tuple: (folder_path, folder_stats_dict) on success,
+               (folder_path, {'error': message}) on failure.
+    """
+    try:
+        print(f"Processing: {folder_path}")
+        # workers=1: the outer pool already runs one process per core,
+        # so a per-folder reader spawning its own pools would
+        # oversubscribe the machine
+        reader = DocumentReader(max_file_size_mb=max_file_size_mb, workers=1)
+        documents = reader.scan_folder(folder_path)
+
+        # Single compiled pass over the per-doc stats instead of
+        # summing the same dict fields twice in Python
+        doc_count, total_words, _ = summarize_documents(documents)
+
+        folder_stats = {
+            'document_count': doc_count,
+            'total_words': total_words,
+            'documents': [
+                {
+                    'name': d.filename,
+                    'words': d.words,
+                    'size_kb': d.file_size_bytes / 1024
+                }
+                for d in documents
+            ]
+        }
+        return folder_path, folder_stats
+
+    except Exception as e:
+        return folder_path, {'error': str(e)}
+
+
+def _iter_folder_results(folder_list, max_file_size_mb=100):
+    """Yield (folder_path, result) pairs as worker processes finish."""
+    # PDF extraction is CPU-bound, so scan folders in worker processes
+    # to bypass the GIL and scale with cores
+    max_workers = min(len(folder_list), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        sizes = [max_file_size_mb] * len(folder_list)
+        yield from executor.map(_scan_one, folder_list, sizes)
+
+
+def process_multiple_folders(folder_list, max_file_size_mb=100):
+    """Process multiple folders in parallel and compile report."""
     report = {
         'timestamp': datetime.now().isoformat(),
         'folders': {},
@@ -23,42 +77,74 @@ def process_multiple_folders(folder_list):
         }
     }
 
-    for folder_path in folder_list:
-        try:
-            print(f"Processing: {folder_path}")
-            documents = reader.scan_folder(folder_path)
-
-            folder_stats = {
-                'document_count': len(documents),
-                'total_words': sum(d['words'] for d in documents),
-                'documents': [
-                    {
-                        'name': d['filename'],
-                        'words': d['words'],
-                        'size_kb': d['file_size_bytes'] / 1024
-                    }
-                    for d in documents
-                ]
-            }
-
-            report['folders'][str(folder_path)] = folder_stats
-            report['summary']['total_documents'] += len(documents)
-            report['summary']['total_words'] += sum(d['words'] for d in documents)
-
-        except Exception as e:
+    for folder_path, result in _iter_folder_results(folder_list, max_file_size_mb):
+        if 'error' in result:
             report['summary']['failed_folders'].append({
                 'path': str(folder_path),
-                'error': str(e)
+                'error': result['error']
             })
+            continue
+
+        report['folders'][str(folder_path)] = result
+        report['summary']['total_documents'] += result['document_count']
+        report['summary']['total_words'] += result['total_words']
 
     return report
 
+
+def stream_report(folder_list, output_path, max_file_size_mb=100):
+    """
+    Process folders and stream the report to disk folder-by-folder.
+
+    Only the current folder's stats are ever live in memory: each
+    result is serialized with orjson and appended to the open file as
+    workers finish, instead of accumulating one giant report dict and
+    serializing it at the end.
+
+    Returns:
+        dict: The report summary (also written as the trailing
+              "summary" key of the JSON file).
+    """
+    summary = {
+        'total_folders': len(folder_list),
+        'total_documents': 0,
+        'total_words': 0,
+        'failed_folders': []
+    }
+
+    with open(output_path, 'wb') as f:
+        f.write(b'{"timestamp":')
+        f.write(orjson.dumps(datetime.now().isoformat()))
+        f.write(b',"folders":{')
+
+        first = True
+        for folder_path, result in _iter_folder_results(folder_list, max_file_size_mb):
+            if 'error' in result:
+                summary['failed_folders'].append({
+                    'path': str(folder_path),
+                    'error': result['error']
+                })
+                continue
+
+            if not first:
+                f.write(b',')
+            first = False
+            f.write(orjson.dumps(str(folder_path)))
+            f.write(b':')
+            f.write(orjson.dumps(result))
+
+            summary['total_documents'] += result['document_count']
+            summary['total_words'] += result['total_words']
+
+        f.write(b'},"summary":')
+        f.write(orjson.dumps(summary))
+        f.write(b'}')
+
+    return summary
+
 if __name__ == "__main__":
     folders = ['/data', './documents', '/home/user/files']
-    result = process_multiple_folders(folders)
-
-    with open('scan_report.json', 'w') as f:
-        json.dump(result, f, indent=2)
+    summary = stream_report(folders, 'scan_report.json')
 
     print("\nReport saved to: scan_report.json")
-    print(json.dumps(result['summary'], indent=2))
+    print(json.dumps(summary, indent=2))
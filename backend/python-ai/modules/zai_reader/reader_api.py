@@ -12,9 +12,14 @@ Endpoints:
 """
 
 from fastapi import FastAPI, BackgroundTasks, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
+import threading
 import uuid
 import logging
 from datetime import datetime
@@ -23,10 +28,20 @@ from enum import Enum
 # Import the DocumentReader from zai_reader module
 from zai_reader import DocumentReader
 
+try:
+    import redis.asyncio
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# When set (e.g. redis://localhost:6379/0), tasks are shared across
+# uvicorn workers instead of living in one process's memory
+REDIS_URL = os.environ.get("ZAI_REDIS_URL", "")
+
 
 class TaskStatus(str, Enum):
     """Enum for task statuses."""
@@ -68,51 +83,258 @@ class TaskResult(BaseModel):
     error: Optional[str] = None
 
 
-# Global task storage (in production, use Redis or a database)
-tasks_db: Dict[str, TaskResult] = {}
+class InMemoryTaskStore:
+    """
+    Process-local task store.
+
+    Only suitable for a single-worker deployment; with --workers N each
+    process would see its own subset of tasks. Used as the fallback when
+    ZAI_REDIS_URL is not configured.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, TaskResult] = {}
+        self._counters = {
+            'completed': 0, 'failed': 0,
+            'total_documents': 0, 'total_words': 0
+        }
+        # Counter updates arrive from background-task worker threads
+        self._lock = threading.Lock()
+
+    async def save(self, task: TaskResult):
+        self._tasks[task.task_id] = task
+
+    async def get(self, task_id: str) -> Optional[TaskResult]:
+        return self._tasks.get(task_id)
+
+    async def all_tasks(self,
+                        status: Optional[TaskStatus] = None) -> List[TaskResult]:
+        return [
+            task for task in self._tasks.values()
+            if status is None or task.status == status
+        ]
+
+    async def count(self) -> int:
+        return len(self._tasks)
+
+    async def bump_counters(self, **deltas):
+        with self._lock:
+            for key, delta in deltas.items():
+                self._counters[key] += delta
+
+    async def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+
+class RedisTaskStore:
+    """
+    Redis-backed task store for multi-worker deployments.
+
+    Each task lives in a hash task:{uuid} holding its status and the
+    serialized TaskResult; tasks:index and tasks:status:{status} sets
+    support listing and filtering without walking every task in Python.
+
+    Uses the asyncio redis client so round-trips (including saving
+    multi-megabyte completed TaskResults) never block the event loop.
+    """
+
+    def __init__(self, url: str):
+        self._redis = redis.asyncio.Redis.from_url(url, decode_responses=True)
+
+    async def save(self, task: TaskResult):
+        pipe = self._redis.pipeline()
+        pipe.hset(
+            f"task:{task.task_id}",
+            mapping={'status': task.status.value, 'data': task.json()}
+        )
+        pipe.sadd("tasks:index", task.task_id)
+        for status in TaskStatus:
+            if status != task.status:
+                pipe.srem(f"tasks:status:{status.value}", task.task_id)
+        pipe.sadd(f"tasks:status:{task.status.value}", task.task_id)
+        await pipe.execute()
+
+    async def get(self, task_id: str) -> Optional[TaskResult]:
+        data = await self._redis.hget(f"task:{task_id}", "data")
+        return TaskResult.parse_raw(data) if data else None
+
+    async def all_tasks(self,
+                        status: Optional[TaskStatus] = None) -> List[TaskResult]:
+        if status is not None:
+            task_ids = await self._redis.smembers(f"tasks:status:{status.value}")
+        else:
+            task_ids = await self._redis.smembers("tasks:index")
+        tasks = await asyncio.gather(
+            *(self.get(task_id) for task_id in task_ids)
+        )
+        return [task for task in tasks if task is not None]
+
+    async def count(self) -> int:
+        return await self._redis.scard("tasks:index")
+
+    async def bump_counters(self, **deltas):
+        pipe = self._redis.pipeline()
+        for key, delta in deltas.items():
+            pipe.hincrby("tasks:stats", key, delta)
+        await pipe.execute()
+
+    async def counters(self) -> Dict[str, int]:
+        stats = await self._redis.hgetall("tasks:stats")
+        return {
+            key: int(stats.get(key, 0))
+            for key in ('completed', 'failed', 'total_documents', 'total_words')
+        }
+
+
+def _make_task_store():
+    """Build the Redis store when configured, else the in-memory one."""
+    if REDIS_URL and HAS_REDIS:
+        logger.info(f"Using Redis task store at {REDIS_URL}")
+        return RedisTaskStore(REDIS_URL)
+    if REDIS_URL and not HAS_REDIS:
+        logger.warning("ZAI_REDIS_URL set but redis-py not installed; "
+                       "falling back to in-memory task store")
+    return InMemoryTaskStore()
+
+
+# Global task storage; Redis-backed when ZAI_REDIS_URL is set
+task_store = _make_task_store()
+
+# Completion events for long-polling clients, keyed by task_id.
+# Process-local: waiters served by another worker simply fall back to
+# the wait endpoint's timeout and re-read the store.
+task_events: Dict[str, asyncio.Event] = {}
 
 
 app = FastAPI(
     title="ZAI Reader API",
     description="Multi-format document reader with background tasks",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the large TaskResult payloads in C, several
+    # times faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
+# Completed TaskResults embed every document's full text; gzip cuts
+# those megabyte JSON payloads 3-10x for clients that accept it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+def _pin_scan_worker(cpu_ids):
+    """
+    Pool initializer: pin the worker to the allowed CPU set and pre-import
+    PyMuPDF so the first scan doesn't pay import cost.
+    """
+    if cpu_ids and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, cpu_ids)
+        except OSError:
+            pass
+    try:
+        import fitz  # noqa: F401 -- pre-warm the PDF backend
+    except ImportError:
+        pass
+
+
+def _scan_worker(folder_path: str, max_file_size_mb: int):
+    """
+    Run one folder scan inside a pool worker; picklable by design.
+
+    workers=1 keeps the reader serial: the scan pool already dedicates
+    a process per scan, and nested pools in every worker would fork up
+    to workers x cores processes under concurrent requests.
+    """
+    reader = DocumentReader(max_file_size_mb=max_file_size_mb, workers=1)
+    results = reader.scan_folder(folder_path)
+    return results, reader.get_stats()
+
+
+@app.on_event("startup")
+def init_scan_pool():
+    """
+    Create the pre-warmed scan worker pool.
+
+    PDF parsing is CPU-heavy; running it in dedicated worker processes
+    keeps the ASGI event loop (and /tasks, /stats) responsive during
+    large scans.
+    """
+    cpu_count = os.cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):
+        allowed_cpus = os.sched_getaffinity(0)
+    else:
+        allowed_cpus = set()
+
+    app.state.scan_pool = ProcessPoolExecutor(
+        max_workers=max(1, cpu_count // 2),
+        initializer=_pin_scan_worker,
+        initargs=(allowed_cpus,)
+    )
+
 
-def process_folder_task(task_id: str, folder_path: str, max_file_size_mb: int):
+@app.on_event("shutdown")
+def shutdown_scan_pool():
+    app.state.scan_pool.shutdown(wait=False)
+
+
+async def process_folder_task(
+    task_id: str,
+    folder_path: str,
+    max_file_size_mb: int
+):
     """
     Background task to process folder scanning.
 
+    The scan itself runs in the pre-warmed process pool so GIL-heavy
+    parsing never blocks the event loop.
+
     Args:
         task_id (str): Unique task identifier
         folder_path (str): Path to folder to scan
         max_file_size_mb (int): Maximum file size to process
     """
+    task = await task_store.get(task_id)
+    if task is None:
+        logger.error(f"Task {task_id}: Not found in task store")
+        return
+
     try:
         logger.info(f"Task {task_id}: Starting folder scan for {folder_path}")
-        tasks_db[task_id].status = TaskStatus.RUNNING
-
-        # Initialize reader and scan
-        reader = DocumentReader(max_file_size_mb=max_file_size_mb)
-        results = reader.scan_folder(folder_path)
+        task.status = TaskStatus.RUNNING
+        await task_store.save(task)
+
+        # Scan in a worker process, off the event loop
+        loop = asyncio.get_running_loop()
+        results, stats = await loop.run_in_executor(
+            app.state.scan_pool,
+            _scan_worker,
+            folder_path,
+            max_file_size_mb
+        )
 
         # Convert results to DocumentData objects
         documents = [
-            DocumentData(**{
-                'filename': doc['filename'],
-                'text': doc['text'],
-                'words': doc['words'],
-                'file_path': doc['file_path'],
-                'file_size_bytes': doc['file_size_bytes']
-            })
+            DocumentData(
+                filename=doc.filename,
+                text=doc.text,
+                words=doc.words,
+                file_path=str(doc.file_path),
+                file_size_bytes=doc.file_size_bytes
+            )
             for doc in results
         ]
 
         # Update task with results
-        tasks_db[task_id].status = TaskStatus.COMPLETED
-        tasks_db[task_id].documents = documents
-        tasks_db[task_id].stats = reader.get_stats()
-        tasks_db[task_id].completed_at = datetime.now().isoformat()
+        task.status = TaskStatus.COMPLETED
+        task.documents = documents
+        task.stats = stats
+        task.completed_at = datetime.now().isoformat()
+        await task_store.save(task)
+        await task_store.bump_counters(
+            completed=1,
+            total_documents=len(documents),
+            total_words=sum(doc.words for doc in documents)
+        )
 
         logger.info(
             f"Task {task_id}: Completed. "
@@ -121,9 +343,17 @@ def process_folder_task(task_id: str, folder_path: str, max_file_size_mb: int):
 
     except Exception as e:
         logger.error(f"Task {task_id}: Error - {str(e)}")
-        tasks_db[task_id].status = TaskStatus.FAILED
-        tasks_db[task_id].error = str(e)
-        tasks_db[task_id].completed_at = datetime.now().isoformat()
+        task.status = TaskStatus.FAILED
+        task.error = str(e)
+        task.completed_at = datetime.now().isoformat()
+        await task_store.save(task)
+        await task_store.bump_counters(failed=1)
+
+    finally:
+        # Wake any long-polling waiters; we're on the event loop here
+        event = task_events.get(task_id)
+        if event is not None:
+            event.set()
 
 
 @app.get("/", tags=["Health"])
@@ -174,7 +404,8 @@ async def read_folder(
         created_at=datetime.now().isoformat()
     )
 
-    tasks_db[task_id] = task_result
+    await task_store.save(task_result)
+    task_events[task_id] = asyncio.Event()
 
     # Add background task
     background_tasks.add_task(
@@ -206,14 +437,70 @@ async def get_task_status(task_id: str):
     Example:
         GET /read-folder/abc123def456
     """
-    if task_id not in tasks_db:
+    task = await task_store.get(task_id)
+    if task is None:
         logger.warning(f"Task not found: {task_id}")
         raise HTTPException(
             status_code=404,
             detail=f"Task {task_id} not found"
         )
 
-    return tasks_db[task_id]
+    return task
+
+
+@app.get("/read-folder/{task_id}/wait", response_model=TaskResult, tags=["Scanning"])
+async def wait_for_task(task_id: str, timeout: float = 60.0):
+    """
+    Long-poll until a folder scanning task finishes.
+
+    Blocks (without busy-waiting) on the task's completion event and
+    returns the final result in a single round-trip, instead of clients
+    polling GET /read-folder/{task_id} on an interval.
+
+    Args:
+        task_id (str): Unique task identifier
+        timeout (float): Maximum seconds to wait before returning the
+            current (possibly still running) task state. Capped at 300.
+
+    Returns:
+        TaskResult: Final task state, or the in-flight state on timeout
+
+    Raises:
+        HTTPException: If task not found
+
+    Example:
+        GET /read-folder/abc123def456/wait?timeout=120
+    """
+    task = await task_store.get(task_id)
+    if task is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task {task_id} not found"
+        )
+
+    wait_budget = min(timeout, 300.0)
+    event = task_events.get(task_id)
+    if task.status in (TaskStatus.PENDING, TaskStatus.RUNNING):
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=wait_budget)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            # The task was created by another worker, so there is no
+            # local event; poll the shared store instead of returning
+            # immediately (which would turn clients into busy-pollers)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + wait_budget
+            while loop.time() < deadline:
+                await asyncio.sleep(min(0.5, wait_budget))
+                task = await task_store.get(task_id)
+                if task is None or task.status not in (
+                    TaskStatus.PENDING, TaskStatus.RUNNING
+                ):
+                    break
+
+    return await task_store.get(task_id)
 
 
 @app.get("/tasks", tags=["Tasks"])
@@ -231,29 +518,16 @@ async def list_tasks(status: Optional[TaskStatus] = None):
         GET /tasks
         GET /tasks?status=completed
     """
-    if status:
-        filtered_tasks = {
-            task_id: {
-                'task_id': task.task_id,
-                'status': task.status,
-                'folder_path': task.folder_path,
-                'document_count': len(task.documents) if task.documents else 0,
-                'created_at': task.created_at
-            }
-            for task_id, task in tasks_db.items()
-            if task.status == status
-        }
-    else:
-        filtered_tasks = {
-            task_id: {
-                'task_id': task.task_id,
-                'status': task.status,
-                'folder_path': task.folder_path,
-                'document_count': len(task.documents) if task.documents else 0,
-                'created_at': task.created_at
-            }
-            for task_id, task in tasks_db.items()
+    filtered_tasks = {
+        task.task_id: {
+            'task_id': task.task_id,
+            'status': task.status,
+            'folder_path': task.folder_path,
+            'document_count': len(task.documents) if task.documents else 0,
+            'created_at': task.created_at
         }
+        for task in await task_store.all_tasks(status)
+    }
 
     return {
         'total_tasks': len(filtered_tasks),
@@ -266,31 +540,20 @@ async def get_stats():
     """
     Get overall statistics about all tasks.
 
+    Served from rolling counters maintained as tasks complete, so the
+    cost is O(1) regardless of how many tasks and documents exist.
+
     Returns:
         Dict: Statistics about completed tasks and documents
     """
-    completed_tasks = [
-        task for task in tasks_db.values()
-        if task.status == TaskStatus.COMPLETED
-    ]
-
-    total_documents = sum(
-        len(task.documents) if task.documents else 0
-        for task in completed_tasks
-    )
-
-    total_words = sum(
-        sum(doc.words for doc in task.documents)
-        if task.documents else 0
-        for task in completed_tasks
-    )
+    counters = await task_store.counters()
 
     return {
-        'total_tasks': len(tasks_db),
-        'completed_tasks': len(completed_tasks),
-        'failed_tasks': len([t for t in tasks_db.values() if t.status == TaskStatus.FAILED]),
-        'total_documents': total_documents,
-        'total_words': total_words
+        'total_tasks': await task_store.count(),
+        'completed_tasks': counters['completed'],
+        'failed_tasks': counters['failed'],
+        'total_documents': counters['total_documents'],
+        'total_words': counters['total_words']
     }
 
 
@@ -300,9 +563,18 @@ if __name__ == "__main__":
     print("Starting ZAI Reader API server...")
     print("Documentation available at: http://localhost:8000/docs")
 
+    # Multiple workers need the shared Redis task store; stay single-
+    # process on the in-memory fallback
+    workers = max(1, (os.cpu_count() or 1) // 2) if REDIS_URL else 1
+
     uvicorn.run(
-        app,
+        "reader_api:app",
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        # libuv event loop + C HTTP parser: ~2x throughput on the small
+        # status/scan requests this API serves
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        log_level="warning"
     )
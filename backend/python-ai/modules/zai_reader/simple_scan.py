@@ -21,10 +21,10 @@ def main():
     results = scan_folder(folder)
 
     for doc in results:
-        print(f"📄 {doc['filename']}")
-        print(f"   Words: {doc['words']}")
-        print(f"   Size: {doc['file_size_bytes'] / 1024:.1f} KB")
-        print(f"   Preview: {doc['text'][:60]}...")
+        print(f"📄 {doc.filename}")
+        print(f"   Words: {doc.words}")
+        print(f"   Size: {doc.file_size_bytes / 1024:.1f} KB")
+        print(f"   Preview: {doc.text[:60]}...")
         print()
 
     print(f"\nTotal: {len(results)} documents")
@@ -14,29 +14,61 @@ Functions:
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Literal, Optional, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 import logging
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import zlib
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 try:
     import fitz  # PyMuPDF
     HAS_FITZ = True
 except ImportError:
     HAS_FITZ = False
-    logging.warning("PyMuPDF (fitz) not installed. PDF reading disabled.")
+    logger.warning("PyMuPDF (fitz) not installed. PDF reading disabled.")
 
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+try:
+    import cchardet as chardet  # C-accelerated, when available
+    HAS_CHARDET = True
+except ImportError:
+    try:
+        import chardet
+        HAS_CHARDET = True
+    except ImportError:
+        HAS_CHARDET = False
+
+# Works both as part of the modules.zai_reader package and when the
+# scripts in this folder import it flat
+try:
+    from .text_stats import count_words
+except ImportError:
+    from text_stats import count_words
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentStats:
-    """Data class to hold document statistics."""
+    """
+    Data class to hold document statistics.
+
+    slots keeps per-file overhead to a compact record instead of a
+    dict-backed instance, which matters when scans return tens of
+    thousands of results.
+    """
     filename: str
     text: str
     words: int
@@ -44,6 +76,16 @@ class DocumentStats:
     file_size_bytes: int
     encoding: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        """Convert to the 5-key mapping used at the JSON boundary."""
+        return {
+            'filename': self.filename,
+            'text': self.text,
+            'words': self.words,
+            'file_path': str(self.file_path),
+            'file_size_bytes': self.file_size_bytes
+        }
+
 
 class DocumentReader:
     """
@@ -57,9 +99,16 @@ class DocumentReader:
     """
 
     SUPPORTED_FORMATS = ('.txt', '.md', '.pdf')
+    # frozenset membership beats tuple endswith in the walker, and the
+    # suffix it validates travels with the entry so pathlib's suffix
+    # property is never consulted in the hot path
+    _SUFFIX_SET = frozenset(SUPPORTED_FORMATS)
     MAX_FILE_SIZE_MB = 50
 
-    def __init__(self, max_file_size_mb: int = 50, encoding: str = 'utf-8'):
+    def __init__(self, max_file_size_mb: int = 50, encoding: str = 'utf-8',
+                 workers: Optional[int] = None,
+                 cache_path: Optional[str | Path] = None,
+                 backend: Literal['auto', 'fitz', 'pdfium'] = 'auto'):
         """
         Initialize the DocumentReader.
 
@@ -67,13 +116,77 @@ class DocumentReader:
             max_file_size_mb (int): Maximum file size to process in MB.
                                    Defaults to 50.
             encoding (str): Default encoding for text files. Defaults to 'utf-8'.
+            workers (Optional[int]): Worker count for parallel scanning.
+                                     Defaults to the CPU count; pass 1 to
+                                     force a serial scan.
+            cache_path (Optional[str | Path]): Path to an on-disk result
+                                     cache. Unchanged files (same path,
+                                     mtime and size) are served from the
+                                     cache on rescans instead of being
+                                     re-extracted.
+            backend (Literal['auto', 'fitz', 'pdfium']): PDF extraction
+                                     backend. 'auto' prefers pdfium when
+                                     installed (fastest for whole-page
+                                     text), then fitz.
+
+        Raises:
+            ValueError: If an explicitly requested backend is not installed.
         """
         self.max_file_size_mb = max_file_size_mb
+        self._max_bytes = max_file_size_mb * 1024 * 1024
         self.encoding = encoding
+        if workers is not None:
+            self.workers = workers
+        else:
+            # sched_getaffinity respects container/cgroup CPU limits
+            # where cpu_count reports every core on the host
+            try:
+                self.workers = len(os.sched_getaffinity(0))
+            except AttributeError:
+                self.workers = os.cpu_count() or 1
         self.files_read = 0
         self.errors = []
 
-    def scan_folder(self, folder_path: str | Path) -> List[Dict]:
+        if backend == 'auto':
+            self._pdf_backend = (
+                'pdfium' if HAS_PDFIUM else 'fitz' if HAS_FITZ else None
+            )
+        elif backend == 'pdfium' and not HAS_PDFIUM:
+            raise ValueError("pypdfium2 is not installed")
+        elif backend == 'fitz' and not HAS_FITZ:
+            raise ValueError("PyMuPDF is not installed")
+        else:
+            self._pdf_backend = backend
+
+        # Suffix -> handler table: one dict lookup per file instead of
+        # an if/elif chain plus a backend check on every call. Without
+        # a PDF backend '.pdf' is simply absent and those files are
+        # skipped like any unsupported type.
+        self._handlers = {
+            '.txt': self._extract_plaintext,
+            '.md': self._extract_plaintext,
+        }
+        if self._pdf_backend is not None:
+            self._handlers['.pdf'] = self._extract_pdf
+
+        # Optional persistent result cache for incremental rescans: an
+        # unchanged file (same path, mtime_ns and size) is answered from
+        # here without touching its bytes. The connection is shared by
+        # the thread pool, hence check_same_thread=False plus a lock.
+        self._cache: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+        if cache_path is not None:
+            self._cache = sqlite3.connect(
+                str(cache_path), check_same_thread=False
+            )
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS documents "
+                "(key BLOB PRIMARY KEY, text BLOB, words INTEGER, "
+                "encoding TEXT)"
+            )
+            self._cache.commit()
+
+    def scan_folder(self, folder_path: str | Path) -> List[DocumentStats]:
         """
         Scan a folder for supported document types and extract their content.
 
@@ -85,12 +198,9 @@ class DocumentReader:
             folder_path (str | Path): Path to the folder to scan.
 
         Returns:
-            List[Dict]: A list of dictionaries with keys:
-                - filename: Name of the file
-                - text: Extracted text content
-                - words: Number of words in the text
-                - file_path: Full path to the file
-                - file_size_bytes: Size of the file in bytes
+            List[DocumentStats]: One compact record per document with
+                filename, extracted text, word count, path and size.
+                Call .to_dict() on a record at the JSON boundary.
 
         Raises:
             ValueError: If the folder path does not exist.
@@ -100,7 +210,30 @@ class DocumentReader:
             >>> reader = DocumentReader()
             >>> results = reader.scan_folder('/path/to/documents')
             >>> for doc in results:
-            ...     print(f"{doc['filename']}: {doc['words']} words")
+            ...     print(f"{doc.filename}: {doc.words} words")
+        """
+        return list(self.iter_scan_folder(folder_path))
+
+    def iter_scan_folder(self,
+                         folder_path: str | Path) -> Iterator[DocumentStats]:
+        """
+        Scan a folder, yielding each document as it finishes.
+
+        Streaming counterpart of scan_folder for pipeline consumers:
+        records come out as workers complete them, so downstream work
+        (tokenization, embedding) overlaps with extraction and the
+        caller never holds the whole corpus in memory.
+
+        Args:
+            folder_path (str | Path): Path to the folder to scan.
+
+        Yields:
+            DocumentStats: One record per document, in completion order.
+
+        Raises:
+            ValueError: If the folder path does not exist (raised when
+                iteration starts).
+            PermissionError: If permission is denied to read the folder.
         """
         folder_path = Path(folder_path)
 
@@ -110,146 +243,473 @@ class DocumentReader:
         if not folder_path.is_dir():
             raise ValueError(f"Path is not a directory: {folder_path}")
 
-        logger.info(f"Starting folder scan: {folder_path}")
+        logger.info("Starting folder scan: %s", folder_path)
 
-        results = []
         self.files_read = 0
         self.errors = []
 
         try:
-            # Recursively find all supported file types
-            file_patterns = [f"**/*{ext}" for ext in self.SUPPORTED_FORMATS]
-            files_to_process = []
+            # One scandir walk finds every supported file and caches its
+            # size; the parallel path consumes it lazily so extraction
+            # starts while the walk is still running
+            entries = self._iter_files(folder_path)
 
-            for pattern in file_patterns:
-                files_to_process.extend(folder_path.glob(pattern))
+            if self.workers > 1:
+                yield from self._scan_parallel(entries)
+            else:
+                yield from self._scan_serial(entries)
 
-            logger.info(f"Found {len(files_to_process)} supported files")
+            logger.info(
+                "Scan complete: %d files processed, %d errors",
+                self.files_read, len(self.errors)
+            )
+
+        except PermissionError:
+            logger.error("Permission denied accessing folder: %s", folder_path)
+            raise
 
-            for file_path in files_to_process:
+    def _iter_files(self, root: Path):
+        """
+        Walk a directory tree with os.scandir, yielding supported files.
+
+        A single traversal replaces the per-extension glob passes; the
+        suffix is checked on the entry name before stat, and the cached
+        DirEntry.stat result is yielded alongside the path so downstream
+        code never re-stats the file.
+
+        Yields:
+            Tuple[Path, int, int, str, Optional[Callable]]: (file path,
+                size in bytes, mtime_ns, lowercased suffix, extraction
+                handler). The handler is resolved here so the scan loop
+                never inspects the suffix again; it is None for types
+                with no available backend.
+        """
+        handlers = self._handlers
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            name = entry.name
+                            dot = name.rfind('.')
+                            if dot < 0:
+                                continue
+                            suffix = name[dot:].lower()
+                            if suffix not in self._SUFFIX_SET:
+                                continue
+                            handler = handlers.get(suffix)
+                            st = entry.stat()
+                            if st.st_size > self._max_bytes:
+                                # Reject here so oversize files never get
+                                # submitted to (or pickled into) workers
+                                logger.warning(
+                                    "File %s exceeds max size (%.2f MB)",
+                                    entry.name, st.st_size / 1024 / 1024
+                                )
+                                continue
+                            yield (Path(entry.path), st.st_size,
+                                   st.st_mtime_ns, suffix, handler)
+                        except OSError as e:
+                            logger.warning("Skipping %s: %s", entry.path, e)
+            except OSError as e:
+                logger.warning("Cannot read directory %s: %s", current, e)
+
+    def _scan_serial(self, files_to_process) -> Iterator[DocumentStats]:
+        """Process files one at a time on the calling thread."""
+        for file_path, file_size, mtime_ns, suffix, handler in files_to_process:
+            try:
+                doc_data = self._process_file(file_path, file_size,
+                                              mtime_ns, suffix, handler)
+                if doc_data:
+                    self.files_read += 1
+                    yield doc_data
+            except Exception as e:
+                error_msg = f"Error processing {file_path.name}: {str(e)}"
+                logger.error(error_msg)
+                self.errors.append(error_msg)
+
+    # Upper bound on submitted-but-unfinished work: enough to keep every
+    # worker busy while the walker runs ahead, without buffering the
+    # whole tree's worth of futures in memory
+    MAX_INFLIGHT = 256
+
+    def _scan_parallel(self, entries) -> Iterator[DocumentStats]:
+        """
+        Process files concurrently, overlapping traversal with extraction.
+
+        Entries are submitted as the walker discovers them, so the first
+        PDF starts extracting while the directory walk is still running,
+        and a bounded in-flight window keeps memory flat on huge trees.
+        Finished documents are yielded as workers complete them. PDFs go
+        to a process pool (MuPDF parsing is CPU-bound, so this bypasses
+        the GIL); plaintext files go to a thread pool (mostly I/O,
+        threads are cheaper than pickling results across processes).
+        """
+        futures = {}
+        pdf_futures = set()
+        process_pool = None
+        thread_pool = None
+        pdf_handler = self._handlers.get('.pdf')
+
+        def drain(return_when):
+            done, _ = wait(futures, return_when=return_when)
+            ready = []
+            for future in done:
+                file_path, file_size, mtime_ns, suffix = futures.pop(future)
                 try:
-                    doc_data = self._process_file(file_path)
+                    doc_data = future.result()
                     if doc_data:
-                        results.append(doc_data)
+                        # Worker processes have no cache handle, so PDF
+                        # results are stored here; _process_file already
+                        # stored the thread-pool ones itself
+                        if future in pdf_futures:
+                            pdf_futures.discard(future)
+                            self._cache_put(doc_data, mtime_ns)
                         self.files_read += 1
+                        ready.append(doc_data)
                 except Exception as e:
                     error_msg = f"Error processing {file_path.name}: {str(e)}"
                     logger.error(error_msg)
                     self.errors.append(error_msg)
+            return ready
 
-            logger.info(
-                f"Scan complete: {self.files_read} files processed, "
-                f"{len(self.errors)} errors"
-            )
-
-        except PermissionError as e:
-            logger.error(f"Permission denied accessing folder: {folder_path}")
-            raise
-
-        return results
-
-    def _process_file(self, file_path: Path) -> Optional[Dict]:
+        try:
+            for file_path, file_size, mtime_ns, suffix, handler in entries:
+                if len(futures) >= self.MAX_INFLIGHT:
+                    yield from drain(FIRST_COMPLETED)
+
+                if handler is not None and handler == pdf_handler:
+                    # Answer unchanged PDFs from the cache in-process;
+                    # only misses pay the submit/pickle/extract round trip
+                    cached = self._cache_get(file_path, file_size, mtime_ns)
+                    if cached is not None:
+                        self.files_read += 1
+                        yield cached
+                        continue
+                    if process_pool is None:
+                        process_pool = ProcessPoolExecutor(
+                            max_workers=self.workers
+                        )
+                    future = process_pool.submit(
+                        _process_one, str(file_path),
+                        self.max_file_size_mb, self.encoding, file_size,
+                        self._pdf_backend
+                    )
+                    pdf_futures.add(future)
+                else:
+                    # PDFs without a backend take this path too, so the
+                    # usual per-file logging/skips still happen
+                    if thread_pool is None:
+                        thread_pool = ThreadPoolExecutor(
+                            max_workers=min(32, self.workers * 2)
+                        )
+                    future = thread_pool.submit(
+                        self._process_file, file_path, file_size,
+                        mtime_ns, suffix, handler
+                    )
+                futures[future] = (file_path, file_size, mtime_ns, suffix)
+
+            while futures:
+                yield from drain(FIRST_COMPLETED)
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+            if thread_pool is not None:
+                thread_pool.shutdown()
+
+    def _process_file(self, file_path: Path,
+                      file_size: Optional[int] = None,
+                      mtime_ns: Optional[int] = None,
+                      suffix: Optional[str] = None,
+                      handler: Optional[Callable] = None
+                      ) -> Optional[DocumentStats]:
         """
         Process a single file and extract its content.
 
         Args:
             file_path (Path): Path to the file to process.
+            file_size (Optional[int]): Size in bytes, if already known from
+                the directory walk; avoids a redundant stat call.
+            mtime_ns (Optional[int]): Modification time from the walk,
+                used as part of the result-cache key.
+            suffix (Optional[str]): Lowercased suffix from the walk;
+                saves re-parsing the path in the hot path.
+            handler (Optional[Callable]): Extraction handler resolved by
+                the walk; direct callers may omit it, in which case it
+                is looked up from the suffix.
 
         Returns:
-            Optional[Dict]: Dictionary with file data or None if processing fails.
+            Optional[DocumentStats]: Document record or None if processing fails.
         """
-        file_suffix = file_path.suffix.lower()
-
-        # Check file size
-        file_size = file_path.stat().st_size
-        if file_size > self.max_file_size_mb * 1024 * 1024:
+        file_suffix = suffix if suffix is not None else file_path.suffix.lower()
+
+        # The walker already filters oversize files; this covers direct
+        # calls where no cached size was provided
+        if file_size is None:
+            st = file_path.stat()
+            file_size = st.st_size
+            mtime_ns = st.st_mtime_ns
+        if file_size > self._max_bytes:
             logger.warning(
-                f"File {file_path.name} exceeds max size "
-                f"({file_size / 1024 / 1024:.2f} MB)"
+                "File %s exceeds max size (%.2f MB)",
+                file_path.name, file_size / 1024 / 1024
             )
             return None
 
-        # Route to appropriate handler
-        if file_suffix == '.pdf':
-            if not HAS_FITZ:
-                logger.error(f"PDF processing disabled for {file_path.name}")
-                return None
-            text = self._extract_pdf(file_path)
-        elif file_suffix in ('.txt', '.md'):
-            text = self._extract_plaintext(file_path)
-        else:
-            logger.warning(f"Unsupported file type: {file_suffix}")
+        cached = self._cache_get(file_path, file_size, mtime_ns)
+        if cached is not None:
+            return cached
+
+        # The walker already resolved the handler; direct calls route
+        # via the precomputed table
+        if handler is None:
+            handler = self._handlers.get(file_suffix)
+        if handler is None:
+            logger.warning("Unsupported file type: %s", file_suffix)
             return None
 
-        if text is None:
+        extracted = handler(file_path)
+        if extracted is None:
             return None
+        text, word_count, used_encoding = extracted
+
+        doc = DocumentStats(
+            filename=file_path.name,
+            text=text,
+            words=word_count,
+            file_path=file_path,
+            file_size_bytes=file_size,
+            encoding=used_encoding
+        )
+        self._cache_put(doc, mtime_ns)
+        return doc
 
-        word_count = len(text.split())
+    @staticmethod
+    def _cache_key(file_path: Path, file_size: int, mtime_ns: int) -> bytes:
+        """Build the (mtime_ns, size, path) cache key as compact bytes."""
+        return struct.pack('<QQ', mtime_ns, file_size) + str(file_path).encode()
 
-        return {
-            'filename': file_path.name,
-            'text': text,
-            'words': word_count,
-            'file_path': str(file_path),
-            'file_size_bytes': file_size
-        }
+    def _cache_get(self, file_path: Path, file_size: int,
+                   mtime_ns: Optional[int]) -> Optional[DocumentStats]:
+        """
+        Look up a scan result for an unchanged file.
+
+        Returns None on a miss, when the cache is disabled, or when no
+        mtime is available to key on.
+        """
+        if self._cache is None or mtime_ns is None:
+            return None
+        key = self._cache_key(file_path, file_size, mtime_ns)
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT text, words, encoding FROM documents WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return DocumentStats(
+            filename=file_path.name,
+            text=zlib.decompress(row[0]).decode('utf-8'),
+            words=row[1],
+            file_path=file_path,
+            file_size_bytes=file_size,
+            encoding=row[2]
+        )
+
+    def _cache_put(self, doc: DocumentStats,
+                   mtime_ns: Optional[int]) -> None:
+        """Store a scan result, compressed, under its change-detection key."""
+        if self._cache is None or mtime_ns is None:
+            return
+        key = self._cache_key(doc.file_path, doc.file_size_bytes, mtime_ns)
+        blob = zlib.compress(doc.text.encode('utf-8'))
+        with self._cache_lock:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO documents (key, text, words, encoding) "
+                "VALUES (?, ?, ?, ?)", (key, blob, doc.words, doc.encoding)
+            )
+            self._cache.commit()
 
-    def _extract_pdf(self, file_path: Path) -> Optional[str]:
+    def _iter_pdf_pages(self, file_path: Path) -> Iterator[str]:
         """
-        Extract text from a PDF file using PyMuPDF.
+        Yield the text of each PDF page as it is extracted.
+
+        Streaming pages keeps peak memory at one page's worth of text
+        for consumers that aggregate incrementally (word counting,
+        chunked tokenization) instead of holding the whole document.
+        MuPDF's internal store is shrunk every few pages so glyph and
+        image caches stay bounded on very large documents.
 
         Args:
             file_path (Path): Path to the PDF file.
 
-        Returns:
-            Optional[str]: Extracted text or None if extraction fails.
+        Yields:
+            str: Extracted text of one page.
         """
-        if not HAS_FITZ:
-            logger.error("PyMuPDF not available for PDF extraction")
-            return None
+        if self._pdf_backend is None:
+            logger.error("No PDF backend available for extraction")
+            return
 
-        try:
-            doc = fitz.open(file_path)
-            text = ""
+        if self._pdf_backend == 'pdfium':
+            yield from self._iter_pdf_pages_pdfium(file_path)
+        else:
+            yield from self._iter_pdf_pages_fitz(file_path)
 
-            for page_num, page in enumerate(doc):
-                page_text = page.get_text()
-                text += page_text
+    def _iter_pdf_pages_fitz(self, file_path: Path) -> Iterator[str]:
+        """Yield per-page text via PyMuPDF."""
+        _tune_fitz()
+        try:
+            # sort=False skips MuPDF's layout-analysis pass
+            with fitz.open(file_path) as doc:
+                for index, page in enumerate(doc):
+                    yield page.get_text("text", sort=False)
+                    if index % 32 == 31:
+                        fitz.TOOLS.store_shrink(100)
+        except Exception as e:
+            logger.error("PDF extraction error for %s: %s", file_path.name, e)
+            raise
 
-            doc.close()
-            logger.debug(f"Extracted {len(text)} characters from {file_path.name}")
-            return text
+    def _iter_pdf_pages_pdfium(self, file_path: Path) -> Iterator[str]:
+        """
+        Yield per-page text via pypdfium2.
 
+        get_text_range() with no bounds extracts the whole page in one
+        native call, which benchmarks faster than boundary-based
+        extraction for this use case.
+        """
+        try:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    try:
+                        yield textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+            finally:
+                pdf.close()
         except Exception as e:
-            logger.error(f"PDF extraction error for {file_path.name}: {e}")
+            logger.error("PDF extraction error for %s: %s", file_path.name, e)
             raise
 
-    def _extract_plaintext(self, file_path: Path) -> Optional[str]:
+    def _extract_pdf(self, file_path: Path) -> Optional[Tuple[str, int, None]]:
         """
-        Extract text from .txt or .md files.
+        Extract text and word count from a PDF file.
 
-        This method tries multiple encodings if UTF-8 fails.
+        Words are counted per page inside the extraction loop, so the
+        joined document text is never scanned a second time; collecting
+        parts and joining once avoids the quadratic text += page_text
+        pattern on big PDFs.
+
+        Args:
+            file_path (Path): Path to the PDF file.
+
+        Returns:
+            Optional[Tuple[str, int, None]]: (extracted text, word count,
+                None — PDFs carry no source encoding) or None if
+                extraction fails.
+        """
+        if self._pdf_backend is None:
+            logger.error("No PDF backend available for extraction")
+            return None
+
+        words = 0
+        parts = []
+        for page_text in self._iter_pdf_pages(file_path):
+            words += count_words(page_text)
+            parts.append(page_text)
+        text = "".join(parts)
+        logger.debug("Extracted %d characters from %s", len(text), file_path.name)
+        return text, words, None
+
+    # Above this size plaintext files are memory-mapped rather than
+    # read into a heap buffer, so the decoder pulls straight from the
+    # page cache and the raw-bytes copy never exists
+    MMAP_MIN_BYTES = 1 << 20
+
+    def _extract_plaintext(self, file_path: Path) -> Optional[Tuple[str, int]]:
+        """
+        Extract text and word count from .txt or .md files.
+
+        Small files are read with a single read() and decoded in C,
+        avoiding TextIOWrapper's chunked incremental decoding and
+        newline translation. Files over MMAP_MIN_BYTES are memory-mapped
+        and decoded directly from the mapping, so peak memory is the
+        decoded string alone instead of string plus raw buffer.
 
         Args:
             file_path (Path): Path to the text file.
 
         Returns:
-            Optional[str]: Extracted text or None if extraction fails.
+            Optional[Tuple[str, int, str]]: (extracted text, word count,
+                encoding used) or None if extraction fails.
         """
-        encodings = [self.encoding, 'utf-8', 'latin-1', 'cp1252']
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > self.MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    text, used_encoding = self._decode_buffer(mm, file_path)
+            else:
+                text, used_encoding = self._decode_buffer(f.read(), file_path)
+        return text, count_words(text), used_encoding
+
+    def _decode_buffer(self, raw, file_path: Path) -> Tuple[str, str]:
+        """
+        Decode a bytes-like buffer (bytes or mmap) to text.
+
+        The configured encoding is tried first — for the typical UTF-8
+        corpus that is one C-speed decode with no probing at all.
+        chardet's pure-Python prober only runs on the 64 KB prefix after
+        that decode fails, followed by the generic fallback chain.
 
-        for encoding in encodings:
+        Returns:
+            Tuple[str, str]: (decoded text, encoding used)
+        """
+        try:
+            # str(buffer, enc) decodes any bytes-like object, so mmap
+            # contents never round-trip through bytes()
+            return str(raw, self.encoding), self.encoding
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+        if HAS_CHARDET:
+            detected = chardet.detect(bytes(raw[:65536]))
+            detected_encoding = detected.get('encoding')
+            confidence = detected.get('confidence') or 0.0
+
+            if detected_encoding and confidence >= 0.8:
+                try:
+                    return str(raw, detected_encoding), detected_encoding
+                except (UnicodeDecodeError, LookupError):
+                    # Low-quality guess on a short sample; fall through to
+                    # the trial chain below
+                    logger.debug(
+                        "Detected encoding %s failed for %s, trying fallbacks",
+                        detected_encoding, file_path.name
+                    )
+
+        for encoding in ('utf-8', 'latin-1', 'cp1252'):
+            if encoding == self.encoding:
+                continue
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    text = f.read()
+                text = str(raw, encoding)
                 logger.debug(
-                    f"Successfully read {file_path.name} with encoding {encoding}"
+                    "Successfully read %s with encoding %s",
+                    file_path.name, encoding
                 )
-                return text
+                return text, encoding
             except (UnicodeDecodeError, LookupError):
                 continue
 
-        logger.error(f"Could not decode {file_path.name} with any encoding")
+        logger.error("Could not decode %s with any encoding", file_path.name)
         raise UnicodeDecodeError(
             'unknown', b'', 0, 1,
             f"Unable to decode {file_path.name}"
@@ -269,7 +729,44 @@ class DocumentReader:
         }
 
 
-def scan_folder(folder_path: str | Path) -> List[Dict]:
+_fitz_tuned = False
+
+
+def _tune_fitz() -> None:
+    """
+    Apply once-per-process MuPDF tuning.
+
+    Silencing mupdf warnings avoids the per-message buffer churn on
+    damaged PDFs, and small glyph heights skip extra bbox work during
+    text extraction. The MuPDF context is shared by every fitz.open in
+    the process, so this runs once and all subsequent documents in the
+    worker benefit.
+    """
+    global _fitz_tuned
+    if _fitz_tuned or not HAS_FITZ:
+        return
+    fitz.TOOLS.set_small_glyph_heights(True)
+    fitz.TOOLS.mupdf_warnings(False)
+    _fitz_tuned = True
+
+
+def _process_one(file_path: str, max_file_size_mb: int, encoding: str,
+                 file_size: Optional[int] = None,
+                 backend: Literal['auto', 'fitz', 'pdfium'] = 'auto'
+                 ) -> Optional[DocumentStats]:
+    """
+    Process a single file in a pool worker.
+
+    Top-level (and taking plain arguments) so it can be pickled across
+    the process boundary; the per-worker DocumentReader is cheap to build.
+    """
+    _tune_fitz()
+    reader = DocumentReader(max_file_size_mb=max_file_size_mb,
+                            encoding=encoding, backend=backend)
+    return reader._process_file(Path(file_path), file_size)
+
+
+def scan_folder(folder_path: str | Path) -> List[DocumentStats]:
     """
     Convenience function to scan a folder using default settings.
 
@@ -277,12 +774,12 @@ def scan_folder(folder_path: str | Path) -> List[Dict]:
         folder_path (str | Path): Path to the folder to scan.
 
     Returns:
-        List[Dict]: List of dictionaries with document data.
+        List[DocumentStats]: List of document records.
 
     Examples:
         >>> results = scan_folder('/data')
         >>> for doc in results:
-        ...     print(f"{doc['filename']}: {doc['words']} words")
+        ...     print(f"{doc.filename}: {doc.words} words")
     """
     reader = DocumentReader()
     return reader.scan_folder(folder_path)
@@ -292,11 +789,16 @@ if __name__ == "__main__":
     # Example usage
     import json
 
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     test_folder = Path("/data")
     if test_folder.exists():
         reader = DocumentReader()
         results = reader.scan_folder(test_folder)
-        print(json.dumps(results, indent=2))
+        print(json.dumps([doc.to_dict() for doc in results], indent=2))
         print(f"\nStats: {reader.get_stats()}")
     else:
         print(f"Test folder {test_folder} does not exist")
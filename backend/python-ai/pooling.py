@@ -0,0 +1,45 @@
+"""
+pooling.py - Vectorized pooling helpers for the embedding service.
+
+Mean-pooling and L2-normalization over transformer hidden states, written
+as single NumPy expressions so the work runs in BLAS/SIMD kernels instead
+of per-token Python loops.
+"""
+
+import numpy as np
+
+
+def mean_pool(hidden: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Mask-aware mean pooling over the token axis.
+
+    Args:
+        hidden (np.ndarray): Hidden states of shape (batch, seq_len, dim).
+        mask (np.ndarray): Attention mask of shape (batch, seq_len).
+
+    Returns:
+        np.ndarray: Pooled float32 vectors of shape (batch, dim).
+    """
+    # C-contiguous float32 keeps the einsum on the BLAS SGEMM path
+    hidden = np.ascontiguousarray(hidden, dtype=np.float32)
+    mask = mask.astype(np.float32)
+
+    summed = np.einsum("blh,bl->bh", hidden, mask)
+    counts = np.clip(mask.sum(axis=1, keepdims=True), 1.0, None)
+    return summed / counts
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row so dot products become cosine similarities.
+
+    Args:
+        vectors (np.ndarray): Array of shape (batch, dim).
+
+    Returns:
+        np.ndarray: The same array, normalized in place.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.clip(norms, np.finfo(np.float32).tiny, None, out=norms)
+    vectors /= norms
+    return vectors